@@ -7,193 +7,251 @@
 #               Prints a graphic history of player performance over the course of the game at the end.
 
 import random
-from matplotlib import pyplot
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba's njit decorator when Numba isn't installed; the function just runs as plain Python."""
+        return lambda function: function
+
+# Number of spaces on the game board, including "Go". The compiled simulation functions treat this as a constant.
+BOARD_SIZE = 25
+
+# A property's purchase price is this many times its rent
+PRICE_MULTIPLIER = 5
+
+# Owner ID stored for a property that nobody owns (player IDs start at 0)
+NO_OWNER = -1
+
+# Number of dice rolls drawn at a time for the automated and manual game loops
+DICE_BUFFER_SIZE = 1 << 14
 
 
 class RealEstateGame:
     """
-    This object represents a simplified version of the boardgame Monopoly. The object contains a dictionary of spaces
-    (the players) and a dictionary of locations (the game board), along with a list of default place names to name the
-    game board's locations. It has additional data members to track the amount of cash received by players when passing
-    or landing on the first space ("Go").
-
-    Class Interactions: The players of the game are Player class objects stored in a dictionary keyed to the player's
-                        name. The locations in the game are Property class objects that are stored in a dictionary
-                        keyed to the integer that represents the location's position on the board (starting at position
-                        0 for "Go"). Objects of these types have relationships defined by their internal methods such
-                        that movement, property ownership, etc. are all updated to match the RealEstateGame object's
-                        methods of playing the game.
-
-    Methods: __init__, create_spaces, create_player, get_player_account_balance, get_player_current_position,
-             buy_space, move_player, check_game_over, delete_player (for testing), start_game (for game loop)
+    This object represents a simplified version of the boardgame Monopoly. The object contains a dictionary of player
+    IDs (keyed to the names of the players still in the game) and lists of the player names and place names (the game
+    board), along with the default place names to name the game board's locations. It has additional data members to
+    track the amount of cash received by players when passing or landing on the first space ("Go").
+
+    The numbers the game actually runs on (player positions and cash, property owners, rents, and prices) are kept
+    in parallel NumPy arrays indexed by an integer player ID or board position, so that moving a player is a handful
+    of array reads and writes instead of a chain of object method calls.
+
+    Class Interactions: The players of the game are Player class objects, made on request for a player ID (which is
+                        looked up by name through a dictionary of IDs). The locations in the game are Property class
+                        objects, made on request for the integer that represents the location's position on the board
+                        (starting at position 0 for "Go"). Both are thin views over the game's arrays: their methods
+                        read and write the RealEstateGame object's data, so that movement, property ownership, etc.
+                        always match the RealEstateGame object's methods of playing the game.
+
+    Methods: __init__, create_spaces, create_player, get_player, get_player_account_balance,
+             get_player_current_position, buy_space, move_player, check_game_over, delete_player (for testing),
+             start_game (for game loop, which plays it with _run_auto or _run_manual),
+             simulate_batch (for running many automated games at once)
     """
 
+    # Fixed set of data members (no per-object __dict__), for smaller objects and faster attribute access
+    __slots__ = ("_pos", "_cash", "_owner", "_rent", "_price", "_names", "_place_names", "_player_ids",
+                 "_go_cash", "_player_count", "_alive_count", "_rent_list", "_min_rent", "_game_over", "_start_check",
+                 "_verbose")
+
+    # Names for the places on the game board, in board order (shared by every game, so they're tuples)
+    _PLACE_NAMES = ("Go", "Pile of Dirt", "Carved 'X' on a Piece of Driftwood", "Patch of Grass",
+                    "Toll Booth in the Middle of the Desert", "Grassy Gnoll", "A Sassy Troll",
+                    "Singed Thatched-Roof Cottage", "Desert Island", "Dessert Island", "IOU For a House",
+                    "Large Pile of Pogs", "Run-Down Hog Farm", "Italian Restaurant Front", "A Denny's",
+                    "Kuzcotopia", "Water Slide", "Normal Mid-Range House", "Disneyland", "Jurassic World",
+                    "Buckingham Palace", "Istana Nurul Iman Palace", "International Space Station",
+                    "The Moon", "San Diego Studio Apartment")
+    _PLACES_DEFAULT = ("Go", "Place 1", "Place 2", "Place 3", "Place 4", "Place 5", "Place 6", "Place 7",
+                       "Place 8", "Place 9", "Place 10", "Place 11", "Place 12", "Place 13", "Place 14",
+                       "Place 15", "Place 16", "Place 17", "Place 18", "Place 19", "Place 20", "Place 21",
+                       "Place 22", "Place 23", "Place 24")
+
     def __init__(self):
         """
-        Creates a game by initializing an empty player dictionary, creating the "Go" space, and creating a list of names
-        for the 24 additional places that will be created. Initializes the amount of cash for passing "Go" as None and
-        a count of players as 0. Also initializes the game over and start check conditions as false, for use in an
-        automated game loop.
+        Creates a game by initializing an empty player dictionary and creating the "Go" space (the names for the 24
+        additional places that will be created are shared by all games). Initializes the amount of cash for passing
+        "Go" as None and a count of players as 0. Also initializes the game over and start check conditions as false,
+        for use in an automated game loop.
 
         The player_count data member is used to track how many players have been created, so that
         the program knows how many players started the game, even if some are later removed from the player dictionary.
         It is also used to check whether the game can even start (no moving allowed if fewer than 2 players), and to
         filter early-termination of the check_game_over method (since a game can't be over if it hasn't started).
+
+        The state arrays are indexed by player ID (the order players were created in, starting at 0) or by board
+        position. Player arrays grow as players are created; an owner of NO_OWNER means nobody owns the property.
+        Player and place names are kept in lists with the same indexing, so the Player and Property objects only need
+        to know their game and their index. Player and Property objects are only made when something asks for one.
         """
 
+        # Game state arrays (Structure-of-Arrays): the Player and Property objects below are views into these
+        self._pos = np.zeros(0, dtype=np.int8)              # Indexed by player ID: board position
+        self._cash = np.zeros(0, dtype=np.int64)            # Indexed by player ID: cash on hand
+        self._owner = np.full(BOARD_SIZE, NO_OWNER, dtype=np.int8)  # Indexed by board position: owner ID
+        self._rent = np.zeros(BOARD_SIZE, dtype=np.int32)       # Indexed by board position: rent
+        self._price = np.zeros(BOARD_SIZE, dtype=np.int32)      # Indexed by board position: purchase price
+        self._names = []                                    # Indexed by player ID: player name
+        self._place_names = ["Go"] + [None] * (BOARD_SIZE - 1)  # Indexed by board position: place name
+
         # Core data members required for both manual gameplay and game loop automation
-        self._player_dict = {}                            # Keyed to name: Player Objects
-        self._location_dict = {0: Property("Go", 0, 0)}   # Keyed to board position integer: Property Objects
-        self._place_names = ["Go", "Pile of Dirt", "Carved 'X' on a Piece of Driftwood", "Patch of Grass",
-                             "Toll Booth in the Middle of the Desert", "Grassy Gnoll", "A Sassy Troll",
-                             "Singed Thatched-Roof Cottage", "Desert Island", "Dessert Island", "IOU For a House",
-                             "Large Pile of Pogs", "Run-Down Hog Farm", "Italian Restaurant Front", "A Denny's",
-                             "Kuzcotopia", "Water Slide", "Normal Mid-Range House", "Disneyland", "Jurassic World",
-                             "Buckingham Palace", "Istana Nurul Iman Palace", "International Space Station",
-                             "The Moon", "San Diego Studio Apartment"]
-        self._places_default = ["Go", "Place 1", "Place 2", "Place 3", "Place 4", "Place 5", "Place 6", "Place 7",
-                                "Place 8", "Place 9", "Place 10", "Place 11", "Place 12", "Place 13", "Place 14",
-                                "Place 15", "Place 16", "Place 17", "Place 18", "Place 19", "Place 20", "Place 21",
-                                "Place 22", "Place 23", "Place 24"]
+        self._player_ids = {}                                   # Keyed to name: player IDs (players still in game)
         self._go_cash = None                                    # Cash collected for passing "Go"
         self._player_count = 0                                  # Counts players added to game
+        self._alive_count = 0                                   # Counts players still in the game
         self._rent_list = []                                    # Used for reference; determined by create_spaces()
+        self._min_rent = None                                   # Cheapest rent in the rent list, once there is one
 
         # The following data members are only used in a game loop
         self._game_over = False         # Used in the game loop to determine when to stop the game loop
         self._start_check = False       # Used in the game loop to verify that starting conditions are valid
+        self._verbose = False           # Used in the game loop to decide whether to narrate the game as it goes
 
     def get_spaces(self):
-        """Returns the dictionary of locations within the game."""
-        return self._location_dict
+        """Returns a dictionary of the locations within the game, keyed to their board position."""
+        return {position: self._get_space(position) for position in range(BOARD_SIZE)}
+
+    def _get_space(self, position):
+        """Returns a Property object for the board position parameter, or None if there's no space there yet."""
+        if self._place_names[position] is None:
+            return None
+        return Property(self, position)
 
     def get_players(self):
-        """Returns the dictionary of current players."""
-        return self._player_dict
+        """Returns a dictionary of the current players (Player objects), keyed to their names."""
+        return {player_name: Player(self, player_id) for player_name, player_id in self._player_ids.items()}
+
+    def get_player(self, player_id):
+        """Returns a Player object for the player ID parameter (the order players were created in, starting at 0)."""
+        return Player(self, player_id)
 
     def create_spaces(self, go_cash, rent_array):
         """
         Generates a game board using a rent array argument, a specified amount of funds for passing or landing on Go,
-        and the default list of place names. Creates a Property class object for each intended space on the game board
-        and assigns it to the location dictionary (the effective game board, for purposes here), keyed to the position
-        of the space on the game board (which is defined here by the rent index variable). If a duplicate name is
+        and the default list of place names. Fills in the name, rent, and price of each intended space on the game
+        board, at the position of the space on the game board (which is defined here by the rent index variable).
+        Prices are worked out for the whole board at once, as a lookup table alongside the rents. If a duplicate name is
         detected, returns nothing and aborts the process, since the place name list illegitimate/has duplicates.
         (This shouldn't happen with the default name list, but may be relevant if custom name lists are used later).
-
-        Property References: Property object created
         """
 
-        # Copies the rent array for reference by other methods
-        self._rent_list = rent_array
+        # Copies the rent array (and its cheapest rent) for reference by other methods, as a contiguous int32 array that
+        # matches the rent table (a NumPy array of that type is used as-is, without any conversion)
+        rents = np.ascontiguousarray(rent_array, dtype=np.int32)
+        self._rent_list = rents
+        self._min_rent = int(rents.min()) if rents.size > 0 else None
 
         # Checks to make sure all rents are legitimate
-        for rent in rent_array:
-            if rent <= 0:
-                # print("All places must charge at least SOME amount of rent. And definitely can't be negative.")
-                return
+        if (rents <= 0).any():
+            # print("All places must charge at least SOME amount of rent. And definitely can't be negative.")
+            return
 
-        # Define cash for passing "Go"
+        # Define cash for passing "Go", and fill in the rent and price tables (position 0 is "Go")
         self._go_cash = go_cash
+        self._rent[1:rents.size + 1] = rents
+        np.multiply(self._rent, PRICE_MULTIPLIER, out=self._price)
 
-        # Create 24 new spaces:
-        rent_index = 1
-        temp_name_list = ["Go"]                                         # Temporary name blackout list
-        for rent in rent_array:
-            if self._place_names[rent_index] in temp_name_list:         # Cancels if duplicate found
-                # print("create_spaces: A property by this name already exists.")
-                return
+        # Cancels if duplicate names are found among the places that will be used
+        place_names = self._PLACE_NAMES[:rents.size + 1]
+        if len(set(place_names)) != len(place_names):
+            # print("create_spaces: A property by this name already exists.")
+            return
 
-            # Creates a property based on rent/place name and assigns keys it to the correct position
-            self._location_dict[rent_index] = Property(self._place_names[rent_index], rent_index, rent)
-            temp_name_list.append(self._place_names[rent_index])        # Puts the place name on the blackout
-            rent_index += 1                                             # Makes sure next space is at next position
+        # Name the 24 new spaces, each at the next position after "Go"
+        self._place_names[1:rents.size + 1] = place_names[1:]
 
     def create_player(self, player_name, start_cash):
         """
-        Creates a Player class object based on input player name string and starting cash amount, and adds it to the
+        Creates a player based on input player name string and starting cash amount, and adds their ID to the
         RealEstateGame object's player dictionary (keyed to their name), so that the player can be used in the game.
-        Assigns the "Go" Property object from the location dictionary to the player object's location by using the
-        player object's update_location method. Returns nothing/cancels the operation if a player by the same name
-        already exists. The player's number is assigned based on the current number of players in the game.
-
-        Player References: Player object create and its update_location method is called
-        Property References: 1st property object in location dictionary (key 0) is used as argument for update_location
+        The player is given the next player ID, and their name, starting cash, and position ("Go") are written into the
+        game's state lists and arrays at that ID. Returns nothing/cancels the operation if a player by the same name
+        already exists, or if the game is full (player IDs have to fit in the owner array's int8 entries, so a game can
+        have at most 128 players). The player's number is assigned based on the current number of players in the game.
         """
         # Cancel operation without doing anything if the player already exists
-        if player_name in self._player_dict:
+        if player_name in self._player_ids:
             # print("create_player: They already exist!")
             return
 
+        # Cancel if the new player's ID couldn't be stored as a property owner
+        if self._player_count > np.iinfo(self._owner.dtype).max:
+            # print("create_player: The game is full!")
+            return
+
         # Checks to make sure the starting cash is legitimate; if they can't buy anything the game might never end.
         # Check only happens if internal rent list is populated. No way to enforce this, outside of programming order,
         # which is why this is just skipped with no consequence if the list is currently empty.
-        if self._rent_list:
-            if start_cash <= min(self._rent_list):
+        if self._min_rent is not None:
+            if start_cash <= self._min_rent:
                 # print("It's hard to play if you don't have the cash to buy anything.")
                 return
 
         # Increments Player Count / Determines the "Player Number" of the new player (for use in a game loop)
+        player_id = self._player_count
         self._player_count += 1
+        self._alive_count += 1
 
-        # Creates the player and moves them to "Go"
-        self._player_dict[player_name] = Player(player_name, start_cash, self._player_count)
-        self._player_dict[player_name].update_location(self._location_dict[0])
+        # Creates the player, starting on "Go"
+        self._pos = np.append(self._pos, np.int8(0))
+        self._cash = np.append(self._cash, np.int64(start_cash))
+        self._names.append(player_name)
+        self._player_ids[player_name] = player_id
 
     def get_player_account_balance(self, player_name):
         """
-        Returns the account balance of the argument player name's balance using the matching Player object's
-        get_cash method, from the player dictionary. Returns empty if the player is not found.
-
-        Player References: Player object's get_cash method is called
+        Returns the account balance of the argument player name's balance from the cash array, using the matching
+        Player object's ID, from the player dictionary. Returns empty if the player is not found.
         """
 
-        if player_name in self._player_dict:
-            return self._player_dict[player_name].get_cash()
+        if player_name in self._player_ids:
+            return int(self._cash[self._player_ids[player_name]])
         return  # returns None if the player's name wasn't found as a key in the dictionary
 
     def get_player_current_position(self, player_name, get_name=False):
         """
-        Returns the player location on the board (based on player name argument) by using the matching Player object's
-        get_location method, from the player dictionary. Returns empty if the player is not found.
-        Indirectly accesses an object from the place dictionary using the player object's get_location method.
-
-        Player References: Player object's get_location method is called
+        Returns the player location on the board (based on player name argument) from the position array, using the
+        matching Player object's ID, from the player dictionary. Returns empty if the player is not found.
+        Looks up the location's name from the place name list, if asked for.
         """
 
         # Can add "True" flag for get_name parameter to return the location's name instead
         if get_name is True:
-            return self._player_dict[player_name].get_loc().get_name()
+            return self._place_names[self._pos[self._player_ids[player_name]]]
 
         # By default, the program returns the position of the player as an integer, unless flagged to return otherwise
-        if player_name in self._player_dict:
-            return self._player_dict[player_name].get_loc().get_position()
+        if player_name in self._player_ids:
+            return int(self._pos[self._player_ids[player_name]])
         return  # returns None if the player's name wasn't found as a key in the dictionary
 
     def buy_space(self, player_name):
         """
         Determines whether a space can be purchased and purchases it, if it can be, based on the player name parameter.
         Returns True if the transaction is successful and False if it is not, for any reason (for testing purposes).
-        Uses information found in the matching Player object found in the player dictionary. Indirectly accesses a
-        property object from the location dictionary by calling the player object's get_location method.
+        Reads the player's cash and position, and that position's rent, owner, and price, straight from the state
+        arrays, using the ID of the matching player found in the player dictionary.
 
-        Player References: Player object's get_location, get_cash, update_cash, and update_holdings methods are called
-        Property References: For the property object returned by the player object's get_location: get_rent, get_owner,
-                             get_price, and update_owner methods are called
+        The purchase itself is two direct writes to the cash and owner arrays (which is also what the player's
+        holdings are read from).
 
         """
 
         # If the player doesn't exist / is out of the game
-        if player_name not in self._player_dict:
+        if player_name not in self._player_ids:
             # print("buy_space: This player doesn't exist - they can join then next game, THEN try to buy this.")
             return False
 
-        # Temp. Readability Variables
-        player = self._player_dict[player_name]
-        current_loc = self._player_dict[player_name].get_loc()
-        current_rent = self._player_dict[player_name].get_loc().get_rent()
-        current_loc_owner = self._player_dict[player_name].get_loc().get_owner()
-        player_cash = self._player_dict[player_name].get_cash()
-        current_loc_price = self._player_dict[player_name].get_loc().get_price()
+        # Temp. Readability Variables (each looked up once)
+        player_id = self._player_ids[player_name]
+        position = self._pos[player_id]
+        current_rent = self._rent[position]
+        current_loc_owner = self._owner[position]
+        player_cash = self._cash[player_id]
+        current_loc_price = int(self._price[position])
 
         # If the player tries to buy "Go"
         if current_rent == 0:
@@ -201,17 +259,15 @@ class RealEstateGame:
             return False                            # Caused by being silly and trying to buy "Go"
 
         # If the property is already owned by someone else
-        if current_rent != 0 and current_loc_owner is not None:
+        if current_rent != 0 and current_loc_owner != NO_OWNER:
             # print("buy_space: Can't buy someone else's property either!")
             return False                            # Caused by trying to by owned land
 
         # If the player has an account balance greater than the purchase price
         # (Note: they can't buy something that would put them at 0, as they would then lose the game)
         if player_cash > current_loc_price:
-            charge = -1 * current_loc_price
-            player.update_cash(charge)
-            player.update_holdings(current_loc)     # Location added to player inventory
-            current_loc.update_owner(player)        # Player assigned to property as its owner
+            self._cash[player_id] -= current_loc_price
+            self._owner[position] = player_id       # Player assigned to property as its owner (and added to holdings)
             return True
         # print("buy_space: No dough, no show.")
         return False                                # Caused by insufficient funds
@@ -220,20 +276,18 @@ class RealEstateGame:
         """
         Moves a player (player_name) based on a die roll (space_moved) and has them collect cash for
         passing or landing on the "Go" space. If they land in a space owned by another player, they pay rent to them.
-        If they have insufficient funds to pay rent, they lose, and the Player object's lose method is called to resolve
-        property changes, final rent payment, and to remove the player from the game.
+        If they have insufficient funds to pay rent, they lose: they pay what they have as their final rent payment,
+        all their properties are freed, and they are removed from the game.
 
-        Player References: Calls player object's get_cash, get_location, update_location, update_cash, and loser methods
-        Property References: Player get_location method objects use the get_position, get_owner, and get_rent methods
+        All of the bookkeeping is done directly on the game's state arrays, using the player's ID.
 
         Important Note: Once a player has lost, they are deleted entirely from the player dictionary. As such, results
-        of None should be expected for calls using the methods within the RealEstateGame object. Any commands that
-        attempt to make calls using methods from within the Player object itself will result in an error, since the
-        player object no longer exists, and thus the methods called won't exist either (crashing the program).
+        of None should be expected for calls using the methods within the RealEstateGame object. Player objects for
+        them will still work, but only show an empty account with no holdings.
         """
 
         # Check to make sure player exists in dictionary
-        if player_name not in self._player_dict:
+        if player_name not in self._player_ids:
             # print("move_player: I don't think that player is 'all there'.")
             return  # Cancel everything if the player doesn't exist, or no longer exists/lost the game
 
@@ -243,11 +297,12 @@ class RealEstateGame:
             # print("move_player: Please wait for more players.")
             return
 
-        # Player object shortcut for more readable code, as long as they exist
-        player = self._player_dict[player_name]
+        # Player ID and state array shortcuts for more readable code, as long as they exist
+        player_id = self._player_ids[player_name]
+        cash = self._cash
 
         # If the player's account balance is 0
-        if player.get_cash() == 0:
+        if cash[player_id] == 0:
             # print("move_player: No moving for you, penniless foo!")
             return  # Redundant with my program implementation, but readme specifies checking for this
 
@@ -256,42 +311,31 @@ class RealEstateGame:
             # print("move_player: Illegal Move: Stop using weird dice! (Movement must be 1 through 6).")
             return  # illegal move
 
-        # The method will advance the player around the circular board by the number of spaces
-        next_position = spaces_moved + player.get_loc().get_position()
-        if next_position < 25:
-            player.update_location(self._location_dict[next_position])
-
-        # Player moves into another lap and passes or lands on Go (and collects their money)
-        if next_position > 24:
-            player.update_location(self._location_dict[next_position - 25])   # -25 because of "Go"
-            player.update_cash(self._go_cash)
-
-        # After the move is complete the player will pay rent for the new space occupied, if necessary
-        if player.get_loc().get_owner() == player:
-            return  # No self dealing!
-
-        if player.get_loc().get_owner() is None:
-            if player.get_loc().get_rent() == 0:
-                return  # No paying rent on "Go"!
-            return  # this is where a buy prompt would happen in an automated game loop - may expand later
-
-        # If you made it this far down the loop, then you HAVE to pay somebody something
-        rent_due = player.get_loc().get_rent()
-        land_lord = player.get_loc().get_owner()
-
-        # The current player has enough money and pays it to the landlord player
-        if player.get_cash() > rent_due:
-            player.update_cash((-1 * rent_due))
-            land_lord.update_cash(rent_due)
+        # The method will advance the player around the circular board by the number of spaces. If they move into
+        # another lap, they pass or land on Go (and collect their money)
+        next_position = int(self._pos[player_id]) + spaces_moved
+        if next_position >= BOARD_SIZE:
+            cash[player_id] += self._go_cash
+            next_position -= BOARD_SIZE                     # Back around to "Go"
+        self._pos[player_id] = next_position
+
+        # After the move is complete the player will pay rent for the new space occupied, if necessary. Worked out
+        # without branching: no rent is due on "Go" or unowned land (where a buy prompt would happen), and no self
+        # dealing! The landlord gets the rent, or all the player's remaining money if they can't cover it. (Nothing
+        # is paid when there's no landlord, so the NO_OWNER index is never actually paid anything.)
+        land_lord = int(self._owner[next_position])
+        rent_due = int(self._rent[next_position]) * (land_lord != NO_OWNER) * (land_lord != player_id)
+        payment = min(rent_due, int(cash[player_id]))
+        cash[player_id] -= payment
+        cash[land_lord] += payment
+
+        # If the player couldn't cover the rent, they're out of $$$ and out of the game
+        if rent_due == 0 or cash[player_id] > 0:
             return
-
-        # Landlord takes all the player's remaining money
-        land_lord.update_cash(player.get_cash())            # Gets all the $$$
-        player.update_cash((-1 * player.get_cash()))        # Loses all the $$$ (may not be needed due to deleting them)
-        player.loser()                                      # Clears all their holdings and their name from all holdings
+        self._owner[self._owner == player_id] = NO_OWNER    # Clears them as the owner of all their holdings (cash is 0)
         # print(player_name, "has been defeated. They have been removed from the game and all their properties freed.")
-        del self._player_dict[player_name]                  # Player deleted from player list
-        return
+        del self._player_ids[player_name]                   # Player deleted from player list
+        self._alive_count -= 1
 
     def check_game_over(self):
         """
@@ -299,7 +343,6 @@ class RealEstateGame:
         still more than 1 player (or less) remaining in the game. If so, it returns an empty string. If there are one or
         fewer players remaining, it returns the name of the winner.
 
-        Player References: Calls the winning player object's get_name method
         """
 
         # Kill the check if the game can't start yet due to too few players - can only play with 2+ people
@@ -308,320 +351,489 @@ class RealEstateGame:
             return ""
 
         # If there are enough players, check to see if the game is over
-        if len(self._player_dict) > 1:                          # If more than 1 player is left, game on!
+        if self._alive_count > 1:                               # If more than 1 player is left, game on!
             return ""
 
-        for player in self._player_dict:                        # Triggers once there is one player or less left
+        for player in self._player_ids:                         # Triggers once there is one player or less left
             self._game_over = True                              # For use in game loop; flag to end the loop
             # print("Winner!")
-            return self._player_dict[player].get_name()         # Declare the name of the person left: The Winner!
+            return player                                       # Declare the name of the person left: The Winner!
 
     def delete_player(self, player_name):
         """
         Clears a player's holdings and deletes them from the player dictionary, based on player name parameter.
         Primarily to streamline testing the program.
         """
-        if player_name not in self._player_dict:
+        if player_name not in self._player_ids:
             # print("delete_player: Player doesn't exist.")
             return
 
-        player = self._player_dict[player_name]
-        player.loser()                              # Clears all their holdings and their name from all holdings
-        del self._player_dict[player_name]          # The player is deleted from the active players dictionary
+        player_id = self._player_ids[player_name]
+        Player(self, player_id).loser()             # Clears all their holdings and their name from all holdings
+        del self._player_ids[player_name]           # The player is deleted from the active players dictionary
+        self._alive_count -= 1
 
-    def start_game(self, manual=False):
+    def start_game(self, manual=False, verbose=False, plot=True):
         """
         Checks that initial game conditions are valid, and if they are, runs a game until there is a winner. The
         manual parameter defaults to False and determines whether players have agency, or if the whole game will
         be automated. If the default value of False is overridden as True, then players will be prompted to roll the
         dice and make purchasing decisions (and be given the option to quit if they don't want to roll the dice).
+        The verbose parameter defaults to False, so automated games only announce the winner (and any problems with
+        the setup); if it's True, they also narrate the game, including who is left at the end of every round. Manual
+        games are always narrated, since the players need to know what's going on.
+        The plot parameter defaults to True, and graphs each player's cash over the course of the game once there's a
+        winner. Set it to False to skip the graph (and matplotlib's window) entirely, e.g. when running lots of games.
         """
+        self._verbose = verbose or manual
 
         # Starting Check: Make sure we have a legal board and enough players:
-        print("Before we start, let's check things over to make sure everything is legit...")
+        if self._verbose:
+            print("Before we start, let's check things over to make sure everything is legit...")
         if self._start_check is False:
 
             # Check player count and the board
             if self._player_count < 2:
                 return print("You need at least 2 players to start the game. Please add more players and try again.")
-            if len(self._location_dict) != 25:
-                return print("Game board illegal. The board must have exactly 25 spaces. Please correct the board.")
-            if self._location_dict[0].get_name() != "Go":
+            if None in self._place_names:
+                return print("Game board illegal. The board must have exactly " + str(BOARD_SIZE) + " spaces. "
+                             "Please correct the board.")
+            if self._place_names[0] != "Go":
                 return print("The first position must be named 'Go'. Please correct the board.")
             if "None" in self._rent_list:
                 return print("At least one space has illegitimate rent.")
 
             # Make sure players all have at least some starting cash
-            for player in self._player_dict:
-                if self._player_dict[player].get_cash() <= 0:
+            for player_id in self._player_ids.values():
+                player_cash = self._cash[player_id]
+                if player_cash <= 0:
                     return print("All players need to have at least *some* starting cash")
 
                 # Check all players' minimum cash to make sure everyone has at least a chance of buying something.
-                if self._player_dict[player].get_cash() < min(self._rent_list):
+                if player_cash < self._min_rent:
                     return print("The board is too expensive for players. Either give them more cash, or make"
                                  "a game board with cheaper property.")
 
             # If there are enough players (with money) and the board is good, game on!
             self._start_check = True
-            print("Everything looks good! Let's get started!")
+            if self._verbose:
+                print("Everything looks good! Let's get started!")
 
-        # Starts tracking the round of the game and generates lists to store money snapshots at the end of each player's
-        # turn from that round.
-        game_history_dict = {}
+        # Starts tracking the round of the game and preallocates a matrix to store money snapshots (one column per
+        # player ID) at the end of each round, which doubles in size whenever the game runs longer than it has room for.
+        # Players who are out of the game have $0, which is left off of the graph.
+        game_history = np.zeros((256, self._player_count), dtype=np.int64)
         game_round = 0
-        for player_name in self._player_dict:
-            # Records starting cash at round 0 each player key's first value
-            game_history_dict[player_name] = [(game_round, self._player_dict[player_name].get_cash())]
+        game_history[game_round] = self._cash      # Records starting cash at round 0
         game_round += 1  # First turn data will reflect status at the end of the round 1 for each player
 
-        # The Primary Game Loop: This runs until the game hits a game over state yet
+        # Dice rolls come from a NumPy generator (seeded from the random module, so random.seed() still makes games
+        # repeatable). Manual games are played with prompts in a Python loop, automated games without any in one go.
+        dice_rng = np.random.default_rng(random.getrandbits(64))
+        if manual is True:
+            game_history, game_round = self._run_manual(dice_rng, game_history, game_round)
+        else:
+            game_history, game_round = self._run_auto(dice_rng, game_history, game_round)
+
+        # Produces a graph with a line for each player that started the game, to show their financial history over the
+        # course of the game (rounds after they were out of the game are blanked out so their line stops there).
+        # Matplotlib is only imported once there's a graph to draw, so games without one never have to load it.
+        if plot is True:
+            from matplotlib import pyplot
+            if self._verbose:
+                print("Now that we have a winner, let's review the storied history of this game! Graphically!")
+            starting_ids = np.flatnonzero(game_history[0])
+            game_history = game_history[:game_round, starting_ids]
+            pyplot.title("Player Financial History")
+            pyplot.plot(np.arange(game_round), np.where(game_history > 0, game_history, np.nan),
+                        label=[self._names[player_id] for player_id in starting_ids])
+            pyplot.xlabel("Round of the Game")
+            pyplot.ylabel("Player Cash Reserves (in $) at End of Round")
+            pyplot.legend(loc='upper left')
+            pyplot.show()
+
+        # Clear the board for new players - delete all players, resets player count to 0, and wipes ownership
+        if self._verbose:
+            print("Clearing the board for the next game!")
+        self._player_ids = {}
+        self._names = []
+        self._pos = np.zeros(0, dtype=np.int8)
+        self._cash = np.zeros(0, dtype=np.int64)
+        self._owner.fill(NO_OWNER)
+        self._player_count = 0
+        self._alive_count = 0
+
+    def _run_auto(self, dice_rng, game_history, game_round):
+        """
+        Runs an automated game for start_game until there is a winner. The whole game is played by the compiled
+        simulation functions on the state arrays, with dice rolls drawn in bulk from the dice_rng parameter (a NumPy
+        generator), then the players who lost are removed from the game. Records each round's cash in the game_history
+        matrix starting at the game_round row, and returns the history and the number of rounds recorded.
+
+        If the game is verbose, the players left at the end of each round are read back out of the history afterwards
+        and printed all at once, instead of a few prints per turn while the game is being played.
+        """
+        first_round = game_round
+        players_left = self._alive_count
+        while players_left > 1:
+            dice = dice_rng.integers(1, 7, size=DICE_BUFFER_SIZE, dtype=np.int8)
+            game_history, game_round, players_left = _run_game(self._pos, self._cash, self._owner, self._rent,
+                                                               self._price, self._go_cash, dice, game_history,
+                                                               game_round, players_left)
+
+        # Round-by-round report of the players still in the game and their cash
+        if self._verbose:
+            log_lines = []
+            for round_cash in game_history[first_round:game_round]:
+                log_lines.append("\nThe following players are still in the game!")
+                for player_id in np.flatnonzero(round_cash):
+                    log_lines.append(self._names[player_id] + " with: $" + str(round_cash[player_id]))
+            print("\n".join(log_lines))
+
+        # Remove the players who lost along the way all at once: whoever still has money is still in the game (the
+        # simulation functions already freed the properties of everyone who went broke)
+        survivor_ids = np.flatnonzero(self._cash)
+        self._player_ids = {self._names[player_id]: int(player_id) for player_id in survivor_ids}
+        self._alive_count = survivor_ids.size
+        print("\nWe have a winner!")
+        print(self.check_game_over(), "\n")
+        return game_history, game_round
+
+    def _run_manual(self, dice_rng, game_history, game_round):
+        """
+        Runs a manual game for start_game until there is a winner, prompting players to roll the dice, make purchasing
+        decisions, or quit. Dice rolls are drawn in bulk ahead of time from the dice_rng parameter (a NumPy generator)
+        and used up in order, with a fresh batch whenever they run out. Records each round's cash in the game_history
+        matrix starting at the game_round row, and returns the history and the number of rounds recorded.
+        """
+        dice = dice_rng.integers(1, 7, size=DICE_BUFFER_SIZE, dtype=np.int8)
+        dice_index = 0
+
+        # The Primary Game Loop: This runs until the game hits a game over state yet. Each round goes through the IDs
+        # of the players still in the game (the ones with money), in turn order.
         while self._game_over is False:
-            for player_name in list(self._player_dict):
+            for player_id in np.flatnonzero(self._cash):
                 if self.check_game_over() == "":
 
                     # The variables are used for readability; need to rebind after changes
-                    current_location_name = self._player_dict[player_name].get_loc().get_name()
-                    player_cash = self._player_dict[player_name].get_cash()
+                    player = Player(self, player_id)
+                    player_name = self._names[player_id]
+                    current_location_name = self._place_names[self._pos[player_id]]
+                    player_cash = self._cash[player_id]
 
                     print("\nIt's your turn: ", player_name)
                     print(player_name, "currently has", "$" + str(player_cash))
                     print(player_name, "is currently at", current_location_name)
                     temp_holding_names = []
-                    for place in self._player_dict[player_name].get_holdings():
-                        temp_holding_names.append(place.get_name())
+                    for position in np.flatnonzero(self._owner == player_id):
+                        temp_holding_names.append(self._place_names[position])
                     print("Currently owns:", temp_holding_names)
 
-                    # Manual Movement Prompt / Quitting Opportunity
-                    if manual is True:
-                        play = None
-                        while play != "y":
-                            play = input("Would you like to roll the dice and keep playing? (y/n)\n")
-                            if play == "n":
-                                quit_game = input("Would you like to quit? (y/n)\n")
-                                if quit_game == "n":
-                                    play = None
-                                if quit_game == "y":
-                                    print(player_name, "has left the game.")
-                                    self._player_dict[player_name].loser()          # Clears holdings
-                                    del self._player_dict[player_name]              # Removes the player
-                                    play = "y"
+                    # Movement Prompt / Quitting Opportunity
+                    play = None
+                    while play != "y":
+                        play = input("Would you like to roll the dice and keep playing? (y/n)\n")
+                        if play == "n":
+                            quit_game = input("Would you like to quit? (y/n)\n")
+                            if quit_game == "n":
+                                play = None
+                            if quit_game == "y":
+                                print(player_name, "has left the game.")
+                                player.loser()                                  # Clears holdings
+                                del self._player_ids[player_name]               # Removes the player
+                                self._alive_count -= 1
+                                play = "y"
 
                     # Digital rolling of the dice happens automatically here, as long as the player still exists
-                    if player_name in self._player_dict:
-                        dice_roll = random.randint(1, 6)
+                    if player_name in self._player_ids:
+                        if dice_index == DICE_BUFFER_SIZE:
+                            dice = dice_rng.integers(1, 7, size=DICE_BUFFER_SIZE, dtype=np.int8)
+                            dice_index = 0
+                        dice_roll = int(dice[dice_index])
+                        dice_index += 1
                         print(player_name, "has rolled a", dice_roll)
                         self.move_player(player_name, dice_roll)
 
                         # Need to re-check that player is in the dictionary, since if they lost they were deleted
-                        if player_name in self._player_dict:
-                            current_location_name = self._player_dict[player_name].get_loc().get_name()
+                        if player_name in self._player_ids:
+                            position = self._pos[player_id]
+                            current_location_name = self._place_names[position]
                             print(player_name, "has moved to", current_location_name)
 
-                            # Buying Property
-                            if self._player_dict[player_name].get_loc().get_owner() is None:
-                                if self._player_dict[player_name].get_loc().get_rent() != 0:
+                            # Buying Property - player can decide purchase
+                            if self._owner[position] == NO_OWNER:
+                                if self._rent[position] != 0:
                                     print("You may purchase this property!")
-
-                                    # Manual mode - player can decide purchase
-                                    if manual is True:
-                                        purchase = None
-                                        while purchase != "n":
-                                            purchase = input("Would you like to buy this property for $" +
-                                                             str(self._player_dict[player_name].get_loc().get_price())
-                                                             + "? (y/n)\n")
-                                            if purchase == "y":
-                                                self.buy_space(player_name)
-                                                player_cash = self._player_dict[player_name].get_cash()
-                                                if player_cash > self._player_dict[player_name].get_loc().get_price():
-                                                    if self._player_dict[player_name].get_loc().get_name() != "Go":
-                                                        print(player_name, "has purchased", current_location_name)
-                                                    print(player_name, "now has $" + str(player_cash))
-                                                else:
-                                                    print("Woops, looks you can't afford that!")
-                                                    print(player_name, "now has $" + str(player_cash))
-                                                purchase = "n"
-
-                            # Auto/Simulation mode - purchase happens automatically
-                            if manual is False:
-                                self.buy_space(player_name)
-                                player_cash = self._player_dict[player_name].get_cash()
-                                print(player_name, "has purchased", current_location_name)
-                                print(player_name, "now has $" + str(player_cash))
+                                    purchase = None
+                                    while purchase != "n":
+                                        purchase = input("Would you like to buy this property for $" +
+                                                         str(self._price[position]) + "? (y/n)\n")
+                                        if purchase == "y":
+                                            self.buy_space(player_name)
+                                            player_cash = self._cash[player_id]
+                                            if player_cash > self._price[position]:
+                                                if current_location_name != "Go":
+                                                    print(player_name, "has purchased", current_location_name)
+                                                print(player_name, "now has $" + str(player_cash))
+                                            else:
+                                                print("Woops, looks you can't afford that!")
+                                                print(player_name, "now has $" + str(player_cash))
+                                            purchase = "n"
 
                             # Rent payment status, if it can't be bought and isn't owned by None
-                            player = self._player_dict[player_name]
-                            player_cash = self._player_dict[player_name].get_cash()
-                            if player.get_loc().get_owner() == player:
+                            player_cash = self._cash[player_id]
+                            current_loc_owner = self._owner[position]
+                            if current_loc_owner == player_id:
                                 print(player_name, "owns this property. Yay!")
-                            elif self._player_dict[player_name].get_loc().get_owner() is not None:
-                                print(player_name, "had to pay", "$" + str(player.get_loc().get_rent()), "in rent to",
-                                      player.get_loc().get_owner().get_name())
+                            elif current_loc_owner != NO_OWNER:
+                                print(player_name, "had to pay", "$" + str(self._rent[position]), "in rent to",
+                                      self._names[current_loc_owner])
                                 print(player_name, "now has $" + str(player_cash))
 
                     # Checks if player has either gone bankrupt or quit by the end of turn and prints if they have
-                    if player_name not in self._player_dict:
+                    if player_name not in self._player_ids:
                         print(player_name, "has been defeated!")
 
                     # Prints the winner if the game ended during this turn
-                    if self.check_game_over() != "":
+                    winner = self.check_game_over()
+                    if winner != "":
                         print("\nWe have a winner!")
-                        print(self.check_game_over(), "\n")
+                        print(winner, "\n")
 
             # If game is still going, print out the current active players and their cash
             if self.check_game_over() == "":
                 print("\nThe following players are still in the game!")
-                for player_name in self._player_dict:
-                    print(player_name, "with:", "$" + str(self._player_dict[player_name].get_cash()))
-                    game_history_dict[player_name].append((game_round, self._player_dict[player_name].get_cash()))
+                for player_name in self._player_ids:
+                    print(player_name, "with:", "$" + str(self._cash[self._player_ids[player_name]]))
+                if game_round == game_history.shape[0]:
+                    game_history = np.concatenate((game_history, np.zeros_like(game_history)))
+                game_history[game_round] = self._cash
                 game_round += 1
+        return game_history, game_round
 
-        print("Now that we have a winner, let's review the storied history of this game! Graphically!")
-        for player_name in game_history_dict:
-
-            # Iterate through the player data pairs for round/cash values to respective temp lists (for graphing)
-            round_list = []
-            cash_list = []
-
-            # Creates a list of rounds and list of cash-on-hand for that round that correlate by index
-            for pair in game_history_dict[player_name]:
-                round_list.append(pair[0])
-                cash_list.append(pair[1])
+    def simulate_batch(self, game_count, seed=None, max_rounds=10000):
+        """
+        Simulates a batch of independent automated games (game_count of them) and returns a NumPy array with the
+        winning player's number for each game. Every game starts from the current board and players and plays by the
+        same rules as an automated start_game, but the games are run side by side as rows of 2D NumPy arrays, so that
+        each turn is a handful of array operations across the whole batch. The seed parameter seeds the dice rolls,
+        which are drawn ahead of time for 64 rounds (every player in every game) at once.
+        The game itself is left untouched, and no Player or Property objects are involved.
 
-            # Produces a graph for each player to show their financial history over the course of the game
-            pyplot.title("Player Financial History")
-            pyplot.plot(round_list, cash_list, label=player_name)
-        pyplot.xlabel("Round of the Game")
-        pyplot.ylabel("Player Cash Reserves (in $) at End of Round")
-        pyplot.legend(loc='upper left')
-        pyplot.show()
+        Once only a couple of players are left, a game can keep going more or less forever (everyone collects more
+        from "Go" than they lose in rent), so games still going after max_rounds are stopped with a winner of 0.
+        Finished games are dropped from the arrays at the end of each round, so the rest of the batch runs faster.
+        Like start_game, it prints the problem and returns nothing if there aren't enough players or the board isn't
+        finished.
+        """
 
-        # Clear the board for new players - delete all players, resets player count to 0, and wipes ownership
-        print("Clearing the board for the next game!")
-        self._player_dict = {}
-        for place in self._location_dict:
-            self._location_dict[place].update_owner(None)
-        self._player_count = 0
+        # Same player count and board checks as start_game
+        if self._player_count < 2:
+            return print("You need at least 2 players to simulate games. Please add more players and try again.")
+        if None in self._place_names:
+            return print("Game board illegal. The board must have exactly " + str(BOARD_SIZE) + " spaces. "
+                         "Please correct the board.")
+
+        # One row per game: each game gets its own copy of the player and property state arrays, with the same types
+        # (int8 positions and owners, int64 cash that's updated in place)
+        rng = np.random.default_rng(seed)
+        winners = np.zeros(game_count, dtype=np.int64)
+        game_ids = np.arange(game_count)                    # Which game each row of the state arrays belongs to
+        pos = np.tile(self._pos, (game_count, 1))
+        cash = np.tile(self._cash, (game_count, 1))
+        owner = np.tile(self._owner, (game_count, 1))
+        players_left = np.count_nonzero(cash, axis=1)
+        playing = players_left > 1
+        roll_buffer = np.zeros((0, game_count, self._player_count), dtype=np.int8)     # Rounds of dice not yet used
+
+        for game_round in range(max_rounds):
+            games = np.arange(game_ids.size)
+            if roll_buffer.shape[0] == 0:
+                roll_buffer = rng.integers(1, 7, size=(64, games.size, self._player_count), dtype=np.int8)
+            rolls, roll_buffer = roll_buffer[0], roll_buffer[1:]
+            for player_id in range(self._player_count):
+
+                # Only games that are still going, and that this player is still in, get a turn
+                turn = playing & (cash[:, player_id] > 0)
+                if not turn.any():
+                    continue
+
+                # Move the players, collecting their money for passing or landing on "Go"
+                next_position = pos[:, player_id] + rolls[:, player_id]
+                passed_go = next_position >= BOARD_SIZE
+                next_position[passed_go] -= BOARD_SIZE
+                cash[turn & passed_go, player_id] += self._go_cash
+                pos[turn, player_id] = next_position[turn]
+
+                # Pay rent to the landlords in one pass (everything they have, if they can't cover it), and lose the
+                # game if that leaves them with nothing. Games with no rent due just move 0 to the NO_OWNER column.
+                land_lord = owner[games, next_position]
+                rent = self._rent[next_position]
+                owes_rent = turn & (land_lord != NO_OWNER) & (land_lord != player_id)
+                payment = np.minimum(rent * owes_rent, cash[:, player_id])
+                cash[:, player_id] -= payment
+                cash[games, land_lord] += payment
+                broke = owes_rent & (cash[:, player_id] == 0)
+                owner[broke] = np.where(owner[broke] == player_id, NO_OWNER, owner[broke])
+
+                # Buy the spaces that are for sale, where the player can afford it
+                price = self._price[next_position]
+                buys = turn & (land_lord == NO_OWNER) & (rent != 0) & (cash[:, player_id] > price)
+                cash[buys, player_id] -= price[buys]
+                owner[buys, next_position[buys]] = player_id
+
+                # Games end as soon as only one player has any money left
+                players_left -= broke
+                playing &= players_left > 1
+
+            # Record the winners of finished games and drop them from the batch
+            winners[game_ids[~playing]] = np.argmax(cash[~playing], axis=1) + 1
+            game_ids, pos, cash, owner = game_ids[playing], pos[playing], cash[playing], owner[playing]
+            roll_buffer = roll_buffer[:, playing]
+            players_left = players_left[playing]
+            playing = playing[playing]
+            if game_ids.size == 0:
+                break
+
+        return winners
 
 
 class Player:
     """
-    Represents a boardgame player. Has data member to track the player's name, current location, cash,
-    property holdings, and their player number (for potential use in an automated game loop).
+    Represents a boardgame player. Has a data member to track the player's ID (for potential use in an automated game
+    loop). The player's name, current location, and cash live in the game's state lists and arrays, at the player's ID,
+    and are read and written through this object's methods. Their property holdings are whichever places the game's
+    owner array has them down as the owner of.
 
     Class Interactions: This object contains all the information that must be directly associated with a player.
                         It is used by RealEstateGame objects to represent players. It is returned by the Property class
                         object's get_owner method and allows methods in a Property object to access all relevant
                         information about the owner of the property. The Property class is returned by the
                         Player object's get_location method, so that the Player object can access all information about
-                        their current location on the board. Property objects are also stored in the Player
-                        object's holdings list (and get/update holdings functions) so to access information and methods
-                        for properties that the player owns, or is attempting to buy.
+                        their current location on the board. Property objects are also returned by the Player
+                        object's get_holdings function so to access information and methods for properties that the
+                        player owns.
 
     Methods:    get_name, get_location, get_cash, get_holdings, get_player_num (for game loop only), update_cash,
                 update_holdings, update_location, and loser
     """
 
-    def __init__(self, name, start_cash, player_num=None):
+    __slots__ = ("_game", "_player_id")
+
+    def __init__(self, game, player_id):
         """
-        Creates a new player object based on name, starting cash, and player number parameters.
-        Holdings (property owned) are initialized as an empty list, and the player's location is initialized as None
-        (The player will be moved to "Go" as part of the RealEstateGame's create_player method, since the player
-        object has no context for any board locations until it becomes part of the actual game.)
+        Creates a new player object based on the game it belongs to and player ID parameters.
+        The player's name, starting cash, and location are written into the game's state lists and arrays by the
+        RealEstateGame's create_player method.
         """
 
-        self._name = name
-        self._location = None
-        self._cash = start_cash
-        self._holdings = []
-        self._player_num = player_num           # Used to enforce turn-order in the game loop
+        self._game = game
+        self._player_id = int(player_id)        # Index into the game's state arrays; also enforces turn-order
+
+    def __eq__(self, other):
+        """Player objects are equal if they're the same player ID in the same game."""
+        if not isinstance(other, Player):
+            return NotImplemented
+        return self._game is other._game and self._player_id == other._player_id
+
+    def __hash__(self):
+        """Hashes a Player object by its game and player ID, to match __eq__."""
+        return hash((id(self._game), self._player_id))
 
     def get_name(self):
         """Returns the player's name as a string."""
-        return self._name
+        return self._game._names[self._player_id]
 
     def get_loc(self):
         """Returns the player's current location on the game board (as the location object)."""
-        return self._location
+        return self._game._get_space(self._game._pos[self._player_id])
 
     def get_cash(self):
         """Returns the player's current cash holdings."""
-        return self._cash
+        return int(self._game._cash[self._player_id])
 
     def get_holdings(self):
         """
-        Returns a list of the player's current property holdings (as a list of objects). The items in this list are
-        listed in the order that they were purchased.
+        Returns a list of the player's current property holdings (as a list of objects), worked out from the game's
+        owner array. The items in this list are listed in board order.
         """
-        return self._holdings
+        game = self._game
+        return [game._get_space(position) for position in np.flatnonzero(game._owner == self._player_id)]
 
     def get_player_num(self):
         """Returns the player's number, which is used to determine turn order."""
-        return self._player_num
+        return self._player_id + 1
 
     def update_cash(self, amount):
         """
         Adds or removes cash from the player's account, depending on if the argument is positive or negative.
         Based on amount parameter.
         """
-        self._cash += amount
+        self._game._cash[self._player_id] += amount
 
     def update_holdings(self, property_obj):
         """
         Adds or removes a property object from the player's holdings, based on an argument property object.
+        Holdings are read straight from the game's owner array, which the buy function has already updated, so there
+        is nothing left to record here.
         """
 
-        # Don't need to check for ownership, since that's handled by the buy function
-        self._holdings.append(property_obj)
-        return
-
     def update_location(self, location):
         """
         Updates the player's location (a location object keyed to its integer position on the game board)
         based on input parameter.
         """
-        self._location = location
-        return
+        self._game._pos[self._player_id] = location._position
 
     def loser(self):
         """
-        If the player has lost the game, clears them as the owner of all their holdings and clears their holdings list.
+        If the player has lost the game, clears them as the owner of all their holdings (which empties their holdings),
+        and empties their account (so the simulation functions know they're out of the game).
         """
-        for place in self._holdings:    # Updates the owner for all place objects in their holdings list
-            place.update_owner(None)
-        self._holdings = None           # Usage of None here to differentiate start/bankruptcy conditions
-        return
+        game = self._game
+        game._owner[game._owner == self._player_id] = NO_OWNER  # Frees all their property in one array write
+        game._cash[self._player_id] = 0
 
 
 class Property:
     """
-    Represents a boardgame property location. Has data members to record the property's name, position on the
-    game board, rent cost, purchase price, and the current owner's name.
+    Represents a boardgame property location. Has a data member to record the property's position on the game board.
+    The property's name, rent cost, purchase price, and current owner live in the game's state lists and arrays, at
+    the property's position, and are read and written through this object's methods.
 
     Class Interactions: This object contains all the information that must be directly associated with a property
                         location within a RealEstateGame object. It is returned by a Player object's get_location
                         method and allows methods in a Player object to access all relevant information about their
-                        current position on the board. Property objects are also stored in Player objects' holdings list
-                        (and get/update holdings functions) to access information and methods for properties that a
-                        player owns, or is attempting to buy.
+                        current position on the board. Property objects are also returned by Player objects'
+                        get_holdings function to access information and methods for properties that a player owns.
 
     Methods: get_name, get_position, get_rent, get_price, get_owner, update_cash, and update_owner
     """
 
-    def __init__(self, name, position, rent):
+    __slots__ = ("_game", "_position")
+
+    def __init__(self, game, position):
         """
-        Creates a new property based on name, location, and rent parameters.
-        Name, location, and rent are derived from an argument received by the RealEstateGame class. Initial owner is
-        set to None, until someone purchases it.
+        Creates a new property based on the game it belongs to and location parameters.
+        Location is derived from an argument received by the RealEstateGame class. Name, rent, and price are filled
+        in by the RealEstateGame's create_spaces method, and the owner stays as None until someone purchases it.
         """
-        self._name = name
-        self._position = position
-        self._rent = rent
-        self._price = 5 * self._rent
-        self._owner = None
+        self._game = game
+        self._position = int(position)          # Plain int, even when read out of a NumPy array
+
+    def __eq__(self, other):
+        """Property objects are equal if they're the same position on the same game's board."""
+        if not isinstance(other, Property):
+            return NotImplemented
+        return self._game is other._game and self._position == other._position
+
+    def __hash__(self):
+        """Hashes a Property object by its game and position, to match __eq__."""
+        return hash((id(self._game), self._position))
 
     def get_name(self):
         """Returns the property's name as a string."""
-        return self._name
+        return self._game._place_names[self._position]
 
     def get_position(self):
         """Returns the property's position as an integer."""
@@ -629,46 +841,132 @@ class Property:
 
     def get_rent(self):
         """Returns the property's rent price."""
-        return self._rent
+        return int(self._game._rent[self._position])
 
     def get_price(self):
         """Returns the property's purchase price (5x the cost of rent)."""
-        return self._price
+        return int(self._game._price[self._position])
 
     def get_owner(self):
         """Returns the current property's owner's player object."""
-        return self._owner
+        owner_id = self._game._owner[self._position]
+        if owner_id == NO_OWNER:
+            return None
+        return Player(self._game, owner_id)
 
     def update_owner(self, owner):
         """Updates the property's current owner based on owner object parameter."""
-        self._owner = owner
+        if owner is None:
+            self._game._owner[self._position] = NO_OWNER
+        else:
+            self._game._owner[self._position] = owner._player_id
+
+
+@njit(cache=True)
+def _run_turn(player_id, roll, pos, cash, owner, rent, price, go_cash):
+    """
+    Plays one automated turn for the player ID parameter directly on the game's state arrays: moves them by the roll
+    (collecting the go_cash for passing or landing on "Go"), pays any rent due (losing the game and freeing all their
+    properties if they can't afford it), and buys the space they landed on if it's for sale and they can afford it.
+    Same rules as RealEstateGame's move_player and buy_space methods.
+    """
+
+    # Move the player, collecting their money for passing or landing on "Go"
+    next_position = pos[player_id] + roll
+    if next_position >= BOARD_SIZE:
+        cash[player_id] += go_cash
+        next_position -= BOARD_SIZE
+    pos[player_id] = next_position
+
+    # Pay rent to the landlord, or hand over everything and lose the game. Worked out with arithmetic instead of
+    # branches: nothing is due (or paid to the NO_OWNER index) on unowned land, or on the player's own property
+    land_lord = owner[next_position]
+    rent_due = rent[next_position] * (land_lord != NO_OWNER) * (land_lord != player_id)
+    payment = min(rent_due, cash[player_id])
+    cash[player_id] -= payment
+    cash[land_lord] += payment
+    if rent_due > 0:
+        if cash[player_id] == 0:
+            for position in range(BOARD_SIZE):
+                if owner[position] == player_id:
+                    owner[position] = NO_OWNER
+        return
 
+    # Buy the space if it's for sale and the player can afford it (can't buy "Go" or something that would leave them $0)
+    if land_lord == NO_OWNER and rent[next_position] != 0 and cash[player_id] > price[next_position]:
+        cash[player_id] -= price[next_position]
+        owner[next_position] = player_id
 
-def setup_default_game(player_count):
+
+@njit(cache=True)
+def _run_round(pos, cash, owner, rent, price, go_cash, dice, roll_index, players_left):
+    """
+    Plays one automated round of a game directly on the game's state arrays: each player still in the game takes a
+    turn, in turn order, using up dice rolls in order from the dice array starting at the roll_index parameter. The
+    round stops early if only one player is left (players_left is the number still in the game when it starts).
+    Returns the index of the next unused dice roll and the number of players left.
+    """
+    for player_id in range(cash.shape[0]):
+        if players_left > 1 and cash[player_id] > 0:
+            _run_turn(player_id, dice[roll_index], pos, cash, owner, rent, price, go_cash)
+            roll_index += 1
+            if cash[player_id] == 0:
+                players_left -= 1
+    return roll_index, players_left
+
+
+@njit(cache=True)
+def _run_game(pos, cash, owner, rent, price, go_cash, dice, history, game_round, players_left):
+    """
+    Plays automated rounds of a game directly on the game's state arrays, in turn order, until only one player has
+    any money left, or until there aren't enough dice rolls left for another full round. Dice rolls are used up in
+    order from the dice array. Each player's cash at the end of each round (with $0 for players who have lost) is
+    recorded in the history matrix, starting at the game_round row. The final round, which the winner finishes alone,
+    is not recorded. The players_left parameter is the number of players still in the game (anyone with money).
+    Returns the history (which doubles in size whenever the game runs longer than it has room for), the next round
+    number, and the number of players left, so that the game can be continued with a fresh set of dice.
+    """
+    player_count = cash.shape[0]
+    roll_index = 0
+    while players_left > 1 and roll_index + player_count <= dice.shape[0]:
+        roll_index, players_left = _run_round(pos, cash, owner, rent, price, go_cash, dice, roll_index, players_left)
+        if players_left > 1:
+            if game_round == history.shape[0]:
+                bigger_history = np.zeros((2 * game_round, player_count), dtype=np.int64)
+                bigger_history[:game_round] = history
+                history = bigger_history
+            history[game_round] = cash
+            game_round += 1
+    return history, game_round, players_left
+
+
+def setup_default_game(player_count, verbose=False):
     """
     Quickly sets up a game based on the parameter player count, using default amounts for rent and starting cash.
     Players names are assigned as Player 1, Player 2, etc. in order as they are created.
     Player number (for turn order) is assigned in the order the player is created. Early bird gets the worm!
+    The verbose parameter defaults to False; if it's True, what's being created is printed out (all at once).
     """
 
     # Creates the default game board
     default_game = RealEstateGame()
-    print("Creating the Game Board...")
-    default_rents = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150, 200, 200, 200, 250, 250, 250, 300, 300,
-                     300, 350, 350, 350]
+    default_rents = np.array([50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150, 200, 200, 200, 250, 250, 250,
+                              300, 300, 300, 350, 350, 350], dtype=np.int32)
     default_game.create_spaces(50, default_rents)
 
     # Creates the players
-    for num in range(1, player_count + 1):
-        player_name = "Player " + str(num)
-        print("Creating", player_name)
+    player_names = [f"Player {num}" for num in range(1, player_count + 1)]
+    for player_name in player_names:
         default_game.create_player(player_name, 1000)
+    if verbose:
+        print("\n".join(["Creating the Game Board..."] + [f"Creating {player_name}" for player_name in player_names]))
     return default_game
 
 
 # Try The Game Loop Here! Use manual=False to watch the game play itself, or use manual=True to play it for real!
 game = setup_default_game(30)    # Integer parameter determines how many players the board will be set for
 game.start_game(manual=False)    # Use manual=True to test manual gameplay with user prompts; False for autoplay
+#                                  (plot=False skips the graph at the end, for when you just want the winner)
 
 # Ideas to Expand Project:  Doomsday Card Deck class (random event each round from list of events), GUI for game,
 #                           generalized attribute for non-rent classes for community-chest/jail type spaces